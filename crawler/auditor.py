@@ -8,6 +8,22 @@ through the set of pages for content and return a set of
 matching pages.
 
 Revisions:
+- 2026/10/15 : WebPage no longer downloads its own HTML, pages
+               are only downloaded by fetch(), which dropped
+               the Requests dependency
+- 2026/10/15 : Removed has_element(), unused since HTML
+               criteria were removed
+- 2026/10/15 : Pages are searched as UTF-8 bytes, see
+               WebPage.get_html_bytes()
+- 2026/10/15 : Replaced BeautifulSoup with lxml for parsing
+               pages and extracting their links
+- 2026/10/15 : get_html() returns the page's original HTML
+               rather than a prettified copy of the parse tree
+- 2026/10/15 : Added fetch() and crawl() to download pages
+               concurrently with asyncio/aiohttp
+- 2026/10/15 : Pages are now fetched through a shared
+               keep-alive session
+- 2026/10/15 : Switched BeautifulSoup to the lxml parser
 - 2020/07/21 : Updated has_text() function to take "ignore"
                parameter as a set, allowing certain matches
                to be ignored
@@ -19,19 +35,43 @@ This software is licensed under the GPL v3, see LICENSE.txt
 for more information.
 """
 
-import requests
+import aiohttp
+import asyncio
 import re
-from bs4 import BeautifulSoup
+import sys
+import codecs
+import lxml.html
+from lxml import etree
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+
+# Seconds to wait on a server before giving up on a page
+REQUEST_TIMEOUT = 10
+
+# Maximum number of pages downloaded at the same time by crawl()
+CRAWL_CONCURRENCY = 16
+
+# Number of threads crawl() uses to parse downloaded pages
+PARSE_WORKERS = 4
+
+# Lines of UTF-8 HTML end at the same breaks a QTextDocument
+# starts a new line at, so that pages are searched line by
+# line the same way the interface highlights them.
+# _LINE_PREFIX_REGEX matches up to the end of the last line
+# break before a position.
+_LINE_BREAK_REGEX = re.compile(rb'\r\n|[\r\n]|\xe2\x80\xa9')
+_LINE_PREFIX_REGEX = re.compile(rb'.*(?:\r\n|[\r\n]|\xe2\x80\xa9)', re.S)
 
 
 class WebPage:
     """
     A WebPage object is represented by a URL and contains the HTML
-    content of that URL. Attributes can be accessed through a
+    content of that URL, as downloaded by fetch(). Attributes can be accessed through a
     WebPage object's methods:
     
     URL -> get_url() -> str
     HTML -> get_html() -> str
+    HTML (UTF-8) -> get_html_bytes() -> bytes
     LINKS -> get_links() -> {str}
     INTERNAL LINKS -> get_internal_links() -> {str}
     
@@ -40,34 +80,41 @@ class WebPage:
     file extension.
     """
 
-    URL_REGEX = re.compile("^(?P<schema>http:\/\/|https:\/\/)?"
-                           "(?P<domain>[a-z|0-9|\.]+\.[a-z]+)?"
-                           "(?P<page>(?:\/[A-z|0-9|\-|_|~|:|?|[|\]|@|!|$|&|'|(|)|\*|\+|,|;|=]+)*)"
-                           "(?:(?P<extension>\.[a-z]+)|\/)?$")
-
-    def __init__(self, url: str):
+    URL_REGEX = re.compile(r"\A(?P<schema>http://|https://)?"
+                           r"(?P<domain>[a-z0-9.]+\.[a-z]+)?"
+                           r"(?P<page>(?:/[A-Za-z0-9\-_~:?\[\]@!$&'()*+,;=]+)*)"
+                           r"(?:(?P<extension>\.[a-z]+)|/)?\Z")
 
-        assert re.match(WebPage.URL_REGEX, url), f"'WebPage' must be created with valid URL, got {url}."
-        assert re.match(WebPage.URL_REGEX, url), f"'WebPage' object must have valid domain, got {url}."
+    def __init__(self, url: str, content: bytes, encoding: str = None):
 
-        # Retrieve the HTML of a web page
-        page = requests.get(url).content
-        self.soup = BeautifulSoup(page, 'html.parser')
+        match = _parse_url(url)
+        assert match, f"'WebPage' must be created with valid URL, got {url}."
 
         self._url = url
-        self.domain = re.match(WebPage.URL_REGEX, self._url)['domain']
-        self.page = re.match(WebPage.URL_REGEX, self._url)['page']
-
-        # Add each anchor (<a>) tag within the page
-        # to the object's set of links if the anchor
-        # has a href value.
-        self._links = set()
-        for a in self.soup.find_all('a'):
-            if 'href' in a.attrs:
-                self._links.add(a['href'])
 
+        # The same domain and page strings are compared over and
+        # over during a crawl, so they're interned and the page's
+        # hash is worked out once up front
+        self.domain = match['domain'] and sys.intern(match['domain'])
+        self.page = sys.intern(match['page'])
+        self._hash = hash((self.domain, self.page))
+
+        # Parse the page with lxml and collect the href value
+        # of every anchor (<a>) tag that has one. If the page's
+        # encoding still isn't known, lxml picks it up from the
+        # document itself.
+        encoding = _detect_encoding(content, encoding)
+        tree = _parse_html(content, encoding)
+        self._links = set(tree.xpath('//a/@href', smart_strings=False))
         self._internal_links = WebPage.internal_links(self._links, self.domain)
-        self._html_content = self.soup.prettify()
+
+        # Keep the HTML as the server sent it. It is only decoded
+        # once it's actually needed (see _html_content), since most
+        # pages of a crawl never get searched or displayed. lxml
+        # knows of some encodings Python doesn't, pages in those
+        # are decoded as Latin-1, which at least never fails.
+        self._content = content
+        self._encoding = encoding or _codec_name(tree.getroottree().docinfo.encoding) or 'latin-1'
 
     def __repr__(self):
         return f"WebPage({self._url})"
@@ -77,10 +124,7 @@ class WebPage:
 
     def __eq__(self, other):
         if type(other) == WebPage:
-            if other.domain == self.domain and other.page == self.page:
-                return True
-            else:
-                return False
+            return other._hash == self._hash and other.domain == self.domain and other.page == self.page
         else:
             return False
 
@@ -88,7 +132,26 @@ class WebPage:
         return not WebPage.__eq__(self, other)
 
     def __hash__(self):
-        return hash((self.domain, self.page))
+        return self._hash
+
+    @cached_property
+    def _html_content(self) -> str:
+        """
+        HTML contents of WebPage object, decoded on first use
+        """
+        return self._content.decode(self._encoding, errors='replace')
+
+    @cached_property
+    def _html_bytes(self) -> bytes:
+        """
+        HTML contents of WebPage object encoded as UTF-8. Most
+        pages already are, in which case they're left as is.
+        Others are decoded without keeping the decoded text
+        around, which is only kept for pages that are displayed.
+        """
+        if codecs.lookup(self._encoding).name == 'utf-8':
+            return self._content
+        return self._content.decode(self._encoding, errors='replace').encode('utf-8')
 
     def get_url(self) -> str:
         """
@@ -102,6 +165,12 @@ class WebPage:
         """
         return self._html_content
 
+    def get_html_bytes(self) -> bytes:
+        """
+        Return HTML contents of WebPage object as UTF-8 bytes
+        """
+        return self._html_bytes
+
     def get_links(self) -> {str}:
         """
         Return set of all links within WebPage object
@@ -130,7 +199,7 @@ class WebPage:
         # Add all links that are within the domain to
         # internal links
         for l in links:
-            match = re.match(WebPage.URL_REGEX, l)
+            match = _parse_url(l)
             if match is not None and match['extension'] is None:
 
                 # If the URL has the domain in it
@@ -146,38 +215,175 @@ class WebPage:
         return internal_links
 
 
-def has_element(web_pages: {str: WebPage}, container: str) -> {str: WebPage}:
+def _detect_encoding(content: bytes, declared: str) -> str:
+    """
+    Return the encoding a page should be decoded with: the
+    one declared by its server if there is one, or UTF-8 if
+    the page decodes as such. Otherwise return None so that
+    lxml goes by the encoding declared in the page itself.
+    """
+    if declared and _codec_name(declared):
+        return _codec_name(declared)
+    if content.isascii():
+        return 'utf-8'
+    try:
+        content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return None
+
+
+def _codec_name(encoding: str) -> str:
+    """
+    Return Python's name for an encoding, or None if
+    Python doesn't know of it.
+    """
+    try:
+        return codecs.lookup(encoding).name
+    except (LookupError, TypeError):
+        return None
+
+
+def _parse_html(content: bytes, encoding: str) -> lxml.html.HtmlElement:
+    """
+    Parse the bytes of a page into an lxml tree
+    """
+    try:
+        return lxml.html.document_fromstring(content, parser=lxml.html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        # lxml refuses to parse a document with nothing in it
+        return lxml.html.Element('html')
+
+
+@lru_cache(maxsize=65536)
+def _parse_url(url: str) -> re.Match:
+    """
+    Match a URL against WebPage.URL_REGEX. Results are cached
+    since the same links (navigation bars, footers, etc.) show
+    up on nearly every page of a website.
+    """
+    return WebPage.URL_REGEX.match(url)
+
+
+async def fetch(session: aiohttp.ClientSession, url: str, executor: Executor = None) -> WebPage:
     """
-    Given a dictionary of WebPages and element attributes,
-    return another dictionary of WebPages that contain the
-    specified elements.
+    Download a URL without blocking the event loop and
+    return its contents as a WebPage object. The page is
+    parsed in the given executor so that other downloads
+    carry on in the meantime.
     """
-    new_dict = dict()
-    for w in web_pages:
-        if web_pages[w].soup.find_all(container):
-            new_dict[w] = web_pages[w]
-    return new_dict
+    async with session.get(url) as response:
+        content = await response.read()
+        encoding = response.charset
+    return await asyncio.get_running_loop().run_in_executor(executor, WebPage, url, content, encoding)
+
+
+async def crawl(url: str, concurrency: int = CRAWL_CONCURRENCY, on_page=None,
+                pages: {str: WebPage} = None) -> {str: WebPage}:
+    """
+    Crawl a website breadth-first starting from a URL and
+    return a dictionary of all the internal pages that can be
+    traversed from it, in the form {url_str: WebPage}.
+
+    Up to `concurrency` pages are downloaded at once. If given,
+    on_page is called with the dictionary of traversed pages
+    every time a new page is added to it. If given, pages are
+    pages that have already been crawled, which are added to
+    the dictionary returned instead of being crawled again.
+    """
+    traversed_pages = dict(pages or {})
+    seen = {url}.union(traversed_pages)
+    queue = asyncio.Queue()
+
+    def add_page(page: WebPage) -> None:
+        traversed_pages[page.get_url()] = page
+        if on_page is not None:
+            on_page(traversed_pages)
+        for p in page.get_internal_links() - seen:
+            if _parse_url(p):
+                seen.add(p)
+                queue.put_nowait(p)
+
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+
+            async def worker() -> None:
+                while True:
+                    page_url = await queue.get()
+
+                    # If there's something wrong with a page, such as
+                    # it linking to a page that generates an error,
+                    # just skip that page and continue crawling.
+                    try:
+                        add_page(await fetch(session, page_url, executor))
+                    except Exception as e:
+                        print(f"Error crawling {page_url}: {describe_error(e)}")
+                    finally:
+                        queue.task_done()
+
+            # The starting page isn't guarded like the rest, if it
+            # can't be retrieved then the whole crawl has failed.
+            add_page(await fetch(session, url, executor))
+
+            workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+            await queue.join()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    return traversed_pages
+
+
+def _text_not_ignored(html: bytes, text: bytes, ignore: {bytes}) -> bool:
+    """
+    Return True if at least one line of html that contains
+    the text doesn't also contain any of the ignored terms.
+    All of them are UTF-8 bytes, see has_text().
+    """
+    if not ignore:
+        return text in html
+
+    # Only the lines around each occurrence of the text
+    # need to be checked for ignored terms
+    line_start = 0
+    i = html.find(text)
+    while i != -1:
+        line = _LINE_PREFIX_REGEX.match(html, line_start, i)
+        if line:
+            line_start = line.end()
+        line_break = _LINE_BREAK_REGEX.search(html, i + len(text))
+        line_end = line_break.start() if line_break else len(html)
+        if not any(e in html[line_start:line_end] for e in ignore):
+            return True
+        line_start = line_end
+        i = html.find(text, line_end)
+    return False
+
+
+def describe_error(e: Exception) -> str:
+    """
+    Return a description of an error that says what kind of
+    error it is, since some of them, such as the TimeoutError
+    raised when a server doesn't answer, have no message.
+    """
+    return f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
 
 
 def has_text(web_pages: {str: WebPage}, text: str, ignore: {str}) -> {str: WebPage}:
     """
     Given a dictionary of WebPages and a search term,
     return another dictionary of WebPages that contain
-    the specified text within them.
-    """
-    new_dict = dict()
-    for w in web_pages:
-        for line in web_pages[w].get_html().splitlines():
-            if text in line:
-                contains = False
-                for e in ignore:
-                    if e in line:
-                        contains = True
-                        break
-                if not contains:
-                    new_dict[w] = web_pages[w]
-                    break
-    return new_dict
+    the specified text within them, on a line that
+    doesn't contain any of the ignored terms.
+
+    Pages are searched as UTF-8 bytes so that they don't
+    have to be decoded just to be searched.
+    """
+    text = text.encode('utf-8')
+    ignore = {e.encode('utf-8') for e in ignore}
+    return {w: p for w, p in web_pages.items() if _text_not_ignored(p.get_html_bytes(), text, ignore)}
 
 
 def does_not_have_text(web_pages: {str: WebPage}, text: str) -> {str: WebPage}:
@@ -186,16 +392,8 @@ def does_not_have_text(web_pages: {str: WebPage}, text: str) -> {str: WebPage}:
     return another dictionary of WebPages in which
     no pages contain that search term.
     """
-    new_dict = dict()
-    for w in web_pages:
-        contains = False
-        for line in web_pages[w].get_html().splitlines():
-            if text in line:
-                contains = True
-                break
-        if not contains:
-            new_dict[w] = web_pages[w]
-    return new_dict
+    text = text.encode('utf-8')
+    return {w: p for w, p in web_pages.items() if text not in p.get_html_bytes()}
 
 
 if __name__ == '__main__':
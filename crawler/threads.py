@@ -8,6 +8,8 @@ running the scripts in the main thread, thus preventing
 unresponsiveness.
 
 Revisions:
+- 2026/10/15 : find_all_pages() now runs the asynchronous
+               crawler from auditor.py instead of recursing
 - 2020/06/15 : First revision
 
 Copyright (C) 2020 Marcelo Cubillos
@@ -15,8 +17,9 @@ This software is licensed under the GPL v3, see LICENSE.txt
 for more information.
 """
 
-import re
-from crawler.auditor import WebPage
+import asyncio
+import time
+from crawler.auditor import WebPage, crawl, describe_error
 from PyQt5.Qt import QRunnable, pyqtSlot, pyqtSignal, QObject
 
 
@@ -45,51 +48,60 @@ class CrawlerThread(QRunnable):
     executing.
     """
 
-    def __init__(self, url: str):
+    # The pages crawled so far are emitted once EMIT_INTERVAL
+    # new pages have been crawled, or EMIT_PERIOD seconds have
+    # passed since they were last emitted
+    EMIT_INTERVAL = 32
+    EMIT_PERIOD = 0.25
+
+    def __init__(self, url: str, pages: {str: WebPage} = None):
         super(CrawlerThread, self).__init__()
         self.url = url
         self.signals = CrawlerSignals()
-        self.pages = dict()
 
-    def find_all_pages(self, current_page: WebPage, traversed_pages=dict()) -> {str: WebPage}:
+        # Pages crawled before this thread, such as the ones from
+        # the other websites of an imported list, are kept in
+        # self.pages and aren't crawled again
+        self.pages = dict(pages or {})
+        self._last_emit_count = 0
+        self._last_emit_time = time.monotonic()
+
+    def find_all_pages(self, url: str) -> {str: WebPage}:
+        """
+        Crawl a URL and return a dictionary of all the
+        internal pages that can be traversed from it, along
+        with the pages in self.pages, emitting the pages
+        found so far as it goes.
+        """
+        return asyncio.run(crawl(url, on_page=self._page_crawled, pages=self.pages))
+
+    def _page_crawled(self, pages: {str: WebPage}) -> None:
         """
-        Crawl a WebPage recursively and return a dictionary
-        of all the internal pages that can be traversed from
-        that URL.
+        Emit the pages crawled so far, but only in batches so
+        the interface isn't refreshed for every single page.
+        A copy is emitted since the crawl carries on adding to
+        pages while the interface goes through them.
         """
-        # Add current page WebPage object to the traversed
-        # pages dictionary, with URL string as its key
-        traversed_pages[current_page.get_url()] = current_page
-
-        for p in current_page.get_internal_links():
-            if p not in traversed_pages and re.match(WebPage.URL_REGEX, p):
-
-                # Try to create a WebPage object from each URL found,
-                # but if there's something wrong with the anchor,
-                # such as it lacking a href value or linking to a
-                # page that generates an error, just skip
-                # that page and continue crawling.
-                try:
-                    self.signals.pages_crawled.emit(traversed_pages)
-                    traversed_pages.update(self.find_all_pages(WebPage(p), traversed_pages))
-                except Exception as e:
-                    print(f"Error crawling {p}: {e}")
-
-        return traversed_pages
+        now = time.monotonic()
+        if len(pages) - self._last_emit_count >= self.EMIT_INTERVAL or \
+                now - self._last_emit_time > self.EMIT_PERIOD:
+            self._last_emit_count = len(pages)
+            self._last_emit_time = now
+            self.signals.pages_crawled.emit(dict(pages))
 
     @pyqtSlot()
     def run(self) -> None:
         """
-        Crawl a WebPage recursively and emit a dictionary of
-        all WebPages found in the form {url_str: WebPage}
+        Crawl a website and emit a dictionary of all
+        WebPages found in the form {url_str: WebPage}
         """
 
         try:
-            self.pages = self.find_all_pages(WebPage(self.url))
+            self.pages = self.find_all_pages(self.url)
             self.signals.pages_crawled.emit(self.pages)
             self.signals.finished.emit()
         except Exception as e:
-            self.signals.error.emit(str(e))
+            self.signals.error.emit(describe_error(e))
 
 
 if __name__ == '__main__':
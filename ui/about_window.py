@@ -206,7 +206,7 @@ class Ui_Dialog_about(object):
 "Copyright (c) 2020 Marcelo Cubillos\n"
 "Licensed under GPL v3.0\n"
 "\n"
-"Powered by BeautifulSoup and Qt\n"
+"Powered by lxml and Qt\n"
 "Logo created by Shamash Teran\n"
 "Feather Icons by Cole Bemis\n"
 "\n"
@@ -7,6 +7,10 @@ every element of the UI to different methods contained within
 the inheritance.
 
 Revisions:
+- 2026/10/15 : The matched pages are listed in a QListView
+               backed by a QStringListModel
+- 2026/10/15 : Matching now remembers the pages matched by each
+               criterion instead of starting over every time
 - 2021/05/28 : Updated threads to refresh UI for every page
                crawled
 - 2020/07/20 : Replaced criteria attributes from inclusion/
@@ -20,15 +24,16 @@ This software is licensed under the GPL v3, see LICENSE.txt
 for more information.
 """
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QStringListModel
 from PyQt5.Qt import QThreadPool
-from PyQt5.QtWidgets import QMainWindow, QApplication, QDialog, QFileDialog
-from PyQt5.QtGui import QTextBlockFormat, QTextCursor, QIcon, QPixmap
+from PyQt5.QtWidgets import QMainWindow, QApplication, QDialog, QFileDialog, QListWidgetItem
+from PyQt5.QtGui import QTextBlockFormat, QTextCursor, QTextDocument, QIcon, QPixmap
 from crawler.auditor import WebPage, has_text, does_not_have_text
 from ui.main_window import Ui_MainWindow
 from ui.about_window import Ui_Dialog_about
 from crawler.threads import CrawlerThread
 from webbrowser import open_new
+from collections import OrderedDict
 import re
 from sys import exit
 from datetime import date
@@ -40,6 +45,11 @@ class Window:
     """
     Abstract base class for defining GUI windows
     """
+
+    # Icons that have already been loaded, in the format
+    # {relative_path: QIcon}, shared by every window
+    _ICON_CACHE = dict()
+
     @staticmethod
     def resource_path(relative_path):
         """
@@ -49,6 +59,16 @@ class Window:
         base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
         return os.path.join(base_path, relative_path)
 
+    @classmethod
+    def _icon(cls, relative_path: str) -> QIcon:
+        """
+        Return the icon at a resource path, only
+        loading it the first time it's asked for.
+        """
+        if relative_path not in cls._ICON_CACHE:
+            cls._ICON_CACHE[relative_path] = QIcon(cls.resource_path(relative_path))
+        return cls._ICON_CACHE[relative_path]
+
     @staticmethod
     def _quit():
         """
@@ -80,7 +100,15 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
     """
 
     HELP_URL = 'https://github.com/marceloclubhouse/treasure-audit'
-    CONTAINER_REGEX = re.compile("^<?(?P<container>(?:[A-z]|\-|\_|[0-9]|\.)+)>?$")
+    HTML_DOCUMENT_CACHE_SIZE = 8
+
+    # How each kind of criterion is referred to in status messages,
+    # and the label each one is given in listWidget_search_criteria
+    CRITERIA_NAMES = {'include': 'inclusion', 'ignore': 'ignoring', 'exclude': 'exclusion'}
+    CRITERION_PREFIX = {'include': 'Include : ', 'ignore': 'Ignore : ', 'exclude': 'Exclude : '}
+
+    # Where a plain text QTextDocument starts a new block (line)
+    LINE_BREAK_REGEX = re.compile(r'\r\n|[\r\n\u2029]')
 
     def __init__(self):
 
@@ -93,24 +121,41 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         self.thread_pool = QThreadPool()
 
         # Import/set icons
-        self.setWindowIcon(QIcon(self.resource_path('../resources/icon_logo.ico')))
-        self.actionImport.setIcon(QIcon(self.resource_path('../feather/upload.svg')))
-        self.actionExport.setIcon(QIcon(self.resource_path('../feather/download.svg')))
-        self.actionQuit.setIcon(QIcon(self.resource_path('../feather/x-octagon.svg')))
-        self.actionCrawl.setIcon(QIcon(self.resource_path('../feather/layers.svg')))
-        self.actionOpen_Page_in_Web_Browser.setIcon(QIcon(self.resource_path('../feather/external-link.svg')))
-        self.actionClear_Criteria.setIcon(QIcon(self.resource_path('../feather/x.svg')))
-        self.actionRaw_HTML.setIcon(QIcon(self.resource_path('../feather/code.svg')))
-        self.actionRendered_HTML.setIcon(QIcon(self.resource_path('../feather/monitor.svg')))
-        self.actionHighlight_Matches.setIcon(QIcon(self.resource_path('../feather/edit-3.svg')))
-        self.actionVisit_Help_Page.setIcon(QIcon(self.resource_path('../feather/info.svg')))
-        self.actionAbout.setIcon(QIcon(self.resource_path('../feather/users.svg')))
+        self.setWindowIcon(self._icon('../resources/icon_logo.ico'))
+
+        # The actions' icons aren't needed to show the window,
+        # so they're set once the event loop gets going
+        QTimer.singleShot(0, self._load_icons)
 
         # _pages and _matched_pages will be in
         # the format {"URL": WebPage(URL)}
         self.pages = dict()
         self.matched_pages = dict()
 
+        # Laid out HTML documents of recently viewed pages in the
+        # format {"URL": (WebPage(URL), QTextDocument)}, ordered
+        # from least to most recently viewed
+        self._html_documents = OrderedDict()
+        self._empty_html_document = QTextDocument()
+
+        # The WebPages currently displayed in each textBrowser
+        self._html_browser_page = None
+        self._render_browser_page = None
+
+        # Highlighting is held off until the selected page has
+        # stayed selected for a moment, so that scrolling through
+        # the pages list only highlights the page it stops on
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.setInterval(50)
+        self._highlight_timer.timeout.connect(self._highlight_matches)
+
+        # listWidget_matched_pages is a QListView showing the URLs
+        # in _pages_model, _listed_urls holds the same URLs as a set
+        self._pages_model = QStringListModel(self)
+        self.listWidget_matched_pages.setModel(self._pages_model)
+        self._listed_urls = set()
+
         # Imported pages will be a list of URLs to crawl
         self._imported_pages = list()
 
@@ -118,6 +163,18 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         # {'include': {'Firefox', 'Internet Explorer'}, 'ignore': {'Firefox 21.1'}, exclude: {'Google Chrome'}}
         self._criteria = {'include': set(), 'ignore': set(), "exclude": set()}
 
+        # The criteria listWidget_search_criteria currently shows
+        self._last_criteria_signature = None
+
+        # The URLs of the pages matched by each criterion, in the
+        # format {('include', 'Firefox'): {"URL"}}, so criteria
+        # don't have to be searched for again every time another
+        # one is added or removed. _filter_cache_pages holds the
+        # pages the results were worked out for.
+        self._filter_cache = dict()
+        self._filter_cache_ignore = set()
+        self._filter_cache_pages = dict()
+
         # Initialize the format/appearance for
         # QTextBrowser's highlighting done in
         # self._highlight_matches
@@ -128,14 +185,17 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
 
         # Link buttons
         self.pushButton_crawl.clicked.connect(self._crawl)
-        self.pushButton_include.clicked.connect(self._add_inclusion_criteria)
-        self.pushButton_ignore.clicked.connect(self._add_ignore_criteria)
-        self.pushButton_exclude.clicked.connect(self._add_exclusion_criteria)
+        self.pushButton_include.clicked.connect(lambda: self._add_criterion('include'))
+        self.pushButton_ignore.clicked.connect(lambda: self._add_criterion('ignore'))
+        self.pushButton_exclude.clicked.connect(lambda: self._add_criterion('exclude'))
         self.pushButton_clear_criteria.clicked.connect(self._clear_criteria)
         self.pushButton_remove_criterion.clicked.connect(self._remove_criterion)
 
         # Link listWidgets
-        self.listWidget_matched_pages.currentItemChanged.connect(self._update_browsers)
+        self.listWidget_matched_pages.selectionModel().currentChanged.connect(self._update_browsers)
+
+        # Link tabWidgets
+        self.tabWidget_page.currentChanged.connect(self._update_browsers)
 
         # Link action menu items
         self.actionVisit_Help_Page.triggered.connect(self._open_help)
@@ -151,6 +211,22 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         self.actionExport.triggered.connect(self._activate_save_file_dialog)
         self.actionImport.triggered.connect(self._activate_open_file_dialog)
 
+    def _load_icons(self) -> None:
+        """
+        Set the icons of every action in the menu bar and toolbar.
+        """
+        self.actionImport.setIcon(self._icon('../feather/upload.svg'))
+        self.actionExport.setIcon(self._icon('../feather/download.svg'))
+        self.actionQuit.setIcon(self._icon('../feather/x-octagon.svg'))
+        self.actionCrawl.setIcon(self._icon('../feather/layers.svg'))
+        self.actionOpen_Page_in_Web_Browser.setIcon(self._icon('../feather/external-link.svg'))
+        self.actionClear_Criteria.setIcon(self._icon('../feather/x.svg'))
+        self.actionRaw_HTML.setIcon(self._icon('../feather/code.svg'))
+        self.actionRendered_HTML.setIcon(self._icon('../feather/monitor.svg'))
+        self.actionHighlight_Matches.setIcon(self._icon('../feather/edit-3.svg'))
+        self.actionVisit_Help_Page.setIcon(self._icon('../feather/info.svg'))
+        self.actionAbout.setIcon(self._icon('../feather/users.svg'))
+
     def _set_status(self, status: str) -> None:
         """
         Set the bottom status bar message.
@@ -164,13 +240,16 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         """
         self.pages = pages
         self._update_pages()
-        self._update_matched_pages_label();
+        self._update_matched_pages_label()
 
     def _clear_pages(self):
         """
         Reset the crawled pages dictionary.
         """
         self.pages = dict()
+        self._filter_cache.clear()
+        self._filter_cache_pages.clear()
+        self._html_documents.clear()
         self._reset_browsers()
         self._update_pages()
         self._update_matched_pages_label()
@@ -185,6 +264,7 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         else:
             self._highlight_pages = True
             self._set_status("Highlighting matches set to ON.")
+        self._html_browser_page = None
         self._update_browsers()
 
     def _stop_crawling(self, status: str) -> None:
@@ -210,23 +290,77 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         QApplication.restoreOverrideCursor()
         self._update_matched_pages_label()
 
+        # Each website of an imported list adds to the pages
+        # crawled from the ones before it
         if len(self._imported_pages) > 0:
-            self._create_crawler_thread(self._imported_pages.pop())
+            self._create_crawler_thread(self._imported_pages.pop(), self.pages)
 
     def _update_pages(self) -> None:
         """
-        Update the pages listWidget to reflect the WebPages
+        Update the pages list to reflect the WebPages
         within self.pages.
         """
-        current_item = self.listWidget_matched_pages.currentIndex()
-        self.listWidget_matched_pages.clear()
-        if self._criteria != {'include': set(), 'ignore': set(), "exclude": set()}:
-            for p in self.matched_pages:
-                self.listWidget_matched_pages.addItem(p)
+        # Work from one copy of the URLs, so that everything
+        # worked out below agrees on which URLs are listed
+        if not self._criteria_empty():
+            urls = list(self.matched_pages)
         else:
-            for p in self.pages:
-                self.listWidget_matched_pages.addItem(p)
-        self.listWidget_matched_pages.setCurrentIndex(current_item)
+            urls = list(self.pages)
+        listed_urls = set(urls)
+
+        # Only take out the URLs that are no longer listed and
+        # insert the ones that are new rather than rebuilding the
+        # whole list, without repainting the view in between.
+        # The current URL stays selected unless it's taken out.
+        model = self._pages_model
+        self.listWidget_matched_pages.setUpdatesEnabled(False)
+        if not self._listed_urls.issubset(listed_urls):
+            # Rows are taken out in runs, from the bottom up so
+            # that the rows above keep their place
+            listed = model.stringList()
+            end = len(listed)
+            for row in reversed(range(-1, len(listed))):
+                if row == -1 or listed[row] in listed_urls:
+                    if end > row + 1:
+                        model.removeRows(row + 1, end - row - 1)
+                    end = row
+
+        # New URLs are inserted in runs, so the usual case of
+        # newly crawled pages at the end is a single insertion
+        new_urls = list()
+        for row, u in enumerate(urls):
+            if u not in self._listed_urls:
+                new_urls.append(u)
+            elif new_urls:
+                self._insert_urls(row - len(new_urls), new_urls)
+                new_urls = list()
+        if new_urls:
+            self._insert_urls(len(urls) - len(new_urls), new_urls)
+        self._listed_urls = listed_urls
+        self.listWidget_matched_pages.setUpdatesEnabled(True)
+
+    def _insert_urls(self, row: int, urls: [str]) -> None:
+        """
+        Insert a run of URLs into the pages list at a given row.
+        """
+        model = self._pages_model
+        model.insertRows(row, len(urls))
+        for i, u in enumerate(urls, row):
+            model.setData(model.index(i), u)
+
+    def _current_url(self) -> str:
+        """
+        Return the URL currently selected in the pages
+        list, or None if there isn't one.
+        """
+        index = self.listWidget_matched_pages.currentIndex()
+        return index.data() if index.isValid() else None
+
+    def _criteria_empty(self) -> bool:
+        """
+        Return True if no criteria of any kind have been added.
+        """
+        return not (self._criteria['include'] or self._criteria['ignore'] or self._criteria['exclude'])
 
     def _update_matched_pages_label(self) -> None:
         """
@@ -244,35 +378,75 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         """
         Update listWidget_search_criteria to display
         the current criteria populated in self._criteria.
+        Nothing is done if they haven't changed since the
+        last time they were displayed.
         """
+        signature = (frozenset(self._criteria['include']),
+                     frozenset(self._criteria['ignore']),
+                     frozenset(self._criteria['exclude']))
+        if signature == self._last_criteria_signature:
+            return
+        self._last_criteria_signature = signature
+
         self.listWidget_search_criteria.clear()
-        for c in self._criteria:
-            for k in self._criteria[c]:
-                if c == 'include':
-                    self.listWidget_search_criteria.addItem(f"Include : {k}")
-                elif c == 'ignore':
-                    self.listWidget_search_criteria.addItem(f"Ignore : {k}")
-                elif c == 'exclude':
-                    self.listWidget_search_criteria.addItem(f"Exclude : {k}")
+        for c, criteria in self._criteria.items():
+            prefix = self.CRITERION_PREFIX[c]
+            for k in criteria:
+                item = QListWidgetItem(prefix + k)
+
+                # Keep the criterion alongside its label so it
+                # can be removed without parsing the label
+                item.setData(Qt.UserRole, (c, k))
+                self.listWidget_search_criteria.addItem(item)
 
     def _update_browsers(self) -> None:
         """
-        Update both textBrowsers to display the contents
-        of the currently selected WebPage within the
-        matched pages listWidget.
-        """
-        if self.listWidget_matched_pages.currentItem():
-            current_item = self.listWidget_matched_pages.currentItem().text()
-            self.textBrowser_page_render.setText(self.pages[current_item].get_html())
-            self.textBrowser_page_html.setPlainText(self.pages[current_item].get_html())
-            self._highlight_matches()
+        Update the textBrowser of the currently open tab to
+        display the contents of the currently selected WebPage
+        within the matched pages list. The other one is
+        only filled in once its tab is opened.
+        """
+        if current_item := self._current_url():
+            page = self.pages[current_item]
+            if self.tabWidget_page.currentIndex() == 0:
+                if page is not self._html_browser_page:
+                    self.textBrowser_page_html.setDocument(self._html_document(current_item))
+                    self._html_browser_page = page
+                    self._highlight_timer.start()
+            elif page is not self._render_browser_page:
+                self.textBrowser_page_render.setText(page.get_html())
+                self._render_browser_page = page
+
+    def _html_document(self, url: str) -> QTextDocument:
+        """
+        Return a plain text document of the HTML of the page at
+        the given URL, reusing the documents of the most recently
+        viewed pages instead of laying them out again.
+        """
+        page = self.pages[url]
+        if url in self._html_documents and self._html_documents[url][0] is page:
+            self._html_documents.move_to_end(url)
+            return self._html_documents[url][1]
+
+        document = QTextDocument()
+        document.setUndoRedoEnabled(False)
+        document.setDefaultFont(self.textBrowser_page_html.font())
+        document.setPlainText(page.get_html())
+        self._html_documents[url] = (page, document)
+        self._html_documents.move_to_end(url)
+        if len(self._html_documents) > self.HTML_DOCUMENT_CACHE_SIZE:
+            self._html_documents.popitem(last=False)
+        return document
 
     def _reset_browsers(self) -> None:
         """
         Reset both textBrowsers to display nothing.
         """
-        self.textBrowser_page_html.setPlainText("")
+        self.textBrowser_page_html.setDocument(self._empty_html_document)
         self.textBrowser_page_render.setText("")
+        self._html_browser_page = None
+        self._render_browser_page = None
+        self._highlight_timer.stop()
 
     def _highlight_matches(self) -> None:
         """
@@ -280,51 +454,59 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         within self._criteria, highlight any matches
         in the matched pages listWidget.
         """
-        if not self._highlight_pages:
-            return
-        if len(self._criteria["include"]) == 0 and len(self._criteria["exclude"]) == 0:
-            return
+        document = self.textBrowser_page_html.document()
+        cursor = QTextCursor(document)
 
-        for c in self._criteria["include"]:
-
-            page = self.matched_pages[self.listWidget_matched_pages.currentItem().text()].get_html().splitlines()
-            cursor = QTextCursor(self.textBrowser_page_html.document())
-            iteration = -1
-
-            # Since matched_pages already consists of pages containing
-            # the criteria, it can be assumed that findBlockByLineNumber
-            # will always work.
-            for line in page:
-                iteration += 1
-                block = self.textBrowser_page_html.document().findBlockByLineNumber(iteration)
-                block_pos = block.position()
-                cursor.setPosition(block_pos)
-                cursor.select(QTextCursor.LineUnderCursor)
-
-                # It would be preferable if you didn't have to manually
-                # format each block in white if it didn't contain the
-                # text, and would probably save a lot of processing time -
-                # especially on larger pages. That being said, if the else
-                # clause does not explicitly say to format the block as none,
-                # then PyQt won't format the matches as green.
-                if c in line:
-                    contains = False
-                    for e in self._criteria["ignore"]:
-                        if e in line:
-                            contains = True
-                            break
-                    if not contains:
-                        cursor.setBlockFormat(self.highlight_format_green)
-                else:
-                    cursor.setBlockFormat(self.highlight_format_none)
+        # Group every formatting change into one edit block so
+        # the document is only laid out again once at the end
+        cursor.beginEditBlock()
+        try:
+            # Clear the formatting of the whole document at once
+            # rather than line by line, so only the lines that
+            # match have to be visited afterwards. Documents are
+            # reused when a page is selected again, so this is done
+            # even if highlighting has since been switched off.
+            cursor.select(QTextCursor.Document)
+            cursor.setBlockFormat(self.highlight_format_none)
+
+            if not self._highlight_pages or len(self._criteria["include"]) == 0 or \
+                    self._html_browser_page is None:
+                return
 
-    def _create_crawler_thread(self, url: str) -> None:
+            html = self._html_browser_page.get_html()
+            ignore = tuple(self._criteria["ignore"])
+
+            # Find every occurrence of every inclusion criterion in
+            # one sweep over the page, keeping track of which line
+            # each one is on by counting the line breaks before it
+            pattern = re.compile('|'.join(map(re.escape, self._criteria["include"])))
+            line_number = 0
+            line_start = 0
+            line_end = -1
+            for match in pattern.finditer(html):
+                if match.start() <= line_end:
+                    continue
+                for line_break in self.LINE_BREAK_REGEX.finditer(html, line_start, match.start()):
+                    line_number += 1
+                    line_start = line_break.end()
+                line_break = self.LINE_BREAK_REGEX.search(html, match.start())
+                line_end = line_break.start() if line_break else len(html)
+
+                line = html[line_start:line_end]
+                if not any(e in line for e in ignore):
+                    cursor.setPosition(document.findBlockByNumber(line_number).position())
+                    cursor.setBlockFormat(self.highlight_format_green)
+        finally:
+            cursor.endEditBlock()
+
+    def _create_crawler_thread(self, url: str, pages: {str: WebPage} = None) -> None:
         """
         Initialize a separate thread for crawling and
         connect all of the threads signals to
-        their respective interface methods.
+        their respective interface methods. The pages
+        crawled are added to the given pages, if any.
         """
-        self.crawler_thread = CrawlerThread(url)
+        self.crawler_thread = CrawlerThread(url, pages)
         self._set_status(f'Crawling {url} ...')
         self._currently_crawling = True
         QApplication.setOverrideCursor(Qt.WaitCursor)
@@ -351,70 +533,34 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         Prompt the user to open a .txt file and try to crawl
         each of the pages within that file.
         """
-        path = QFileDialog.getOpenFileName(self, "Open web pages", filter="*.txt")
+        if not (file_path := QFileDialog.getOpenFileName(self, "Open web pages", filter="*.txt")[0]):
+            return
         try:
-            if path[0] == '':
-                return
-            file = open(path[0], 'r')
-            for i in file:
-                self._imported_pages.append(i) if '\n' not in i else self._imported_pages.append(i[:-1])
+            # One URL per line, blank lines are skipped
+            with open(file_path, 'r') as file:
+                self._imported_pages.extend(line.rstrip('\r\n') for line in file if line.strip())
             if len(self._imported_pages) > 0:
                 self._create_crawler_thread(self._imported_pages.pop())
         except Exception as e:
-            self._set_status(f"Couldn't open file {path[0]}, error: {e}")
+            self._set_status(f"Couldn't open file {file_path}, error: {e}")
 
-    # In the future, depreciate these 3 separate methods into
-    # one method.
-    def _add_inclusion_criteria(self) -> None:
+    def _add_criterion(self, kind: str) -> None:
         """
         Add text from lineEdit_plain_text to the
-        dictionary of search criteria to include.
+        dictionary of search criteria under kind,
+        which is 'include', 'ignore', or 'exclude'.
         """
         if self.lineEdit_criterion.text() == "":
             self._set_status("Text criteria must be specified to be added.")
             return
 
-        self._criteria["include"].add(self.lineEdit_criterion.text())
+        # Ignored terms still go through _match() since they
+        # decide which lines an included term may be found on
+        self._criteria[kind].add(self.lineEdit_criterion.text())
         self._update_criteria_display()
         self._match()
         self._update_pages()
-        self._set_status(f"Added text \"{self.lineEdit_criterion.text()}\" to inclusion criteria.")
-        self._reset_browsers()
-        self.lineEdit_criterion.setText("")
-        self._update_matched_pages_label()
-
-    def _add_ignore_criteria(self) -> None:
-        """
-        Add text from lineEdit_plain_text to the
-        dictionary of search criteria to ignore.
-        """
-        if self.lineEdit_criterion.text() == "":
-            self._set_status("Text criteria must be specified to be added.")
-            return
-
-        self._criteria["ignore"].add(self.lineEdit_criterion.text())
-        self._update_criteria_display()
-        self._match()
-        self._update_pages()
-        self._set_status(f"Added text \"{self.lineEdit_criterion.text()}\" to ignoring criteria.")
-        self._reset_browsers()
-        self.lineEdit_criterion.setText("")
-        self._update_matched_pages_label()
-
-    def _add_exclusion_criteria(self) -> None:
-        """
-        Add text from lineEdit_plain_text to the
-        dictionary of search criteria to exclude.
-        """
-        if self.lineEdit_criterion.text() == "":
-            self._set_status("Text criteria must be specified to be added.")
-            return
-
-        self._criteria["exclude"].add(self.lineEdit_criterion.text())
-        self._update_criteria_display()
-        self._match()
-        self._update_pages()
-        self._set_status(f"Added text \"{self.lineEdit_criterion.text()}\" to exclusion criteria.")
+        self._set_status(f"Added text \"{self.lineEdit_criterion.text()}\" to {self.CRITERIA_NAMES[kind]} criteria.")
         self._reset_browsers()
         self.lineEdit_criterion.setText("")
         self._update_matched_pages_label()
@@ -424,33 +570,27 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         Reset self._criteria and repopulate
         listWidget_search_criteria.
         """
-        self._criteria = {'include': set(), 'ignore': set(), "exclude": set()}
+        for criteria in self._criteria.values():
+            criteria.clear()
+        self._filter_cache.clear()
+        self.matched_pages = dict()
         self._update_criteria_display()
         self._update_pages()
         self._reset_browsers()
+        self._update_matched_pages_label()
         self._set_status("Cleared criteria.")
 
     def _remove_criterion(self) -> None:
         """
         Remove the current item selected from
-        listWidget_search_criteria from self._criteria
-        by generating indexes for each of the items
-        in the listWidget using the same methodology
-        as the _update_criteria_display method.
+        listWidget_search_criteria from self._criteria,
+        using the (kind, criterion) pair stored in the
+        item by the _update_criteria_display method.
         """
-        iteration_index = 0
-
         if self.listWidget_search_criteria.currentItem():
-            current_item = self.listWidget_search_criteria.currentItem().text()
-            if current_item[0:10] == "Include : ":
-                self._criteria["include"].remove(current_item[10:])
-                self._set_status(f"Removed criterion \"{current_item[10:]}\" from list of inclusion criteria.")
-            elif current_item[0:9] == "Ignore : ":
-                self._criteria["ignore"].remove(current_item[9:])
-                self._set_status(f"Removed criterion \"{current_item[9:]}\" from list of ignoring criteria.")
-            else:
-                self._criteria["exclude"].remove(current_item[10:])
-                self._set_status(f"Removed criterion \"{current_item[10:]}\" from list of exclusion criteria.")
+            kind, criterion = self.listWidget_search_criteria.currentItem().data(Qt.UserRole)
+            self._criteria[kind].discard(criterion)
+            self._set_status(f"Removed criterion \"{criterion}\" from list of {self.CRITERIA_NAMES[kind]} criteria.")
         else:
             return
 
@@ -468,17 +608,64 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         generate self.matched_pages.
         """
 
-        if self._criteria == {'include': set(), 'ignore': set(), 'exclude': set()}:
+        if self._criteria_empty():
+            self.matched_pages = dict()
+            self._filter_cache.clear()
             return
 
-        self.matched_pages = self.pages
-        for k in self._criteria["include"]:
-            self.matched_pages = has_text(self.matched_pages, k, self._criteria["ignore"])
-        for k in self._criteria["exclude"]:
-            self.matched_pages = does_not_have_text(self.matched_pages, k)
+        # Whether a page satisfies an inclusion criterion depends
+        # on the ignored terms, so those results are thrown away
+        # whenever the ignored terms change
+        if self._filter_cache_ignore != self._criteria["ignore"]:
+            self._filter_cache = {key: urls for key, urls in self._filter_cache.items() if key[0] == 'exclude'}
+            self._filter_cache_ignore = set(self._criteria["ignore"])
+
+        # Work from one copy of the pages, so that the pages the
+        # cached results are recorded against are exactly the
+        # ones that were searched
+        pages = dict(self.pages)
+
+        # Bring the cached results up to date with pages that have
+        # been crawled (or crawled again) since they were worked
+        # out, so that only those pages have to be searched
+        new_pages = {u: p for u, p in pages.items() if self._filter_cache_pages.get(u) is not p}
+        old_urls = [u for u in self._filter_cache_pages if pages.get(u) is not self._filter_cache_pages[u]]
+        if new_pages or old_urls:
+            for (kind, k), urls in self._filter_cache.items():
+                urls.difference_update(old_urls)
+                urls.update(self._search_criterion(kind, k, new_pages))
+            self._filter_cache_pages = pages
+
+        # Only criteria that haven't been searched for yet have
+        # to go through every page, the rest come from the cache
+        matched = set(pages)
+        for kind in ('include', 'exclude'):
+            for k in self._criteria[kind]:
+                if (kind, k) not in self._filter_cache:
+                    self._filter_cache[(kind, k)] = self._search_criterion(kind, k, pages)
+                if kind == 'include':
+                    matched &= self._filter_cache[(kind, k)]
+                else:
+                    matched -= self._filter_cache[(kind, k)]
+
+        # Drop results of criteria that have since been removed
+        for key in [key for key in self._filter_cache if key[1] not in self._criteria[key[0]]]:
+            del self._filter_cache[key]
+
+        self.matched_pages = {u: p for u, p in pages.items() if u in matched}
         self._update_pages()
         self._update_matched_pages_label()
 
+    def _search_criterion(self, kind: str, text: str, pages: {str: WebPage}) -> {str}:
+        """
+        Return the URLs of the given pages that satisfy an
+        inclusion criterion, or that contain an excluded term.
+        """
+        if kind == 'include':
+            return set(has_text(pages, text, self._criteria["ignore"]))
+        else:
+            return set(pages).difference(does_not_have_text(pages, text))
+
     def _save_matched_pages(self) -> None:
         """
         Save the list of matched pages as a .txt file
@@ -512,8 +699,8 @@ class AuditInterface(Window, QMainWindow, Ui_MainWindow):
         Open a system web browser pointed to the currently
         selected web page from listWidget_matched_pages.
         """
-        if self.listWidget_matched_pages.currentItem():
-            open_new(self.listWidget_matched_pages.currentItem().text())
+        if current_url := self._current_url():
+            open_new(current_url)
 
     def _open_about_window(self):
         """
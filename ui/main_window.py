@@ -67,7 +67,8 @@ class Ui_MainWindow(object):
         self.label_matched_pages = QtWidgets.QLabel(self.widget)
         self.label_matched_pages.setObjectName("label_matched_pages")
         self.verticalLayout_3.addWidget(self.label_matched_pages)
-        self.listWidget_matched_pages = QtWidgets.QListWidget(self.widget)
+        self.listWidget_matched_pages = QtWidgets.QListView(self.widget)
+        self.listWidget_matched_pages.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.listWidget_matched_pages.setObjectName("listWidget_matched_pages")
         self.verticalLayout_3.addWidget(self.listWidget_matched_pages)
         self.widget1 = QtWidgets.QWidget(self.splitter)